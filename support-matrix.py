@@ -1,12 +1,149 @@
 #!/usr/bin/env python3
 import re
-import json
+import sys
 import datetime
+import orjson
 import requests
-from bs4 import BeautifulSoup
+import lxml.html
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from lxml import etree
-from lxml.builder import ElementMaker
-from jinja2 import Template
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util import Retry
+
+SECTIONS_XPATH = etree.XPath("//section[@id]")
+COMPONENTS_SECTION_XPATH = etree.XPath(
+    ".//section[@data-id-title='Components Versions']"
+)
+AVAILABILITY_DATE_XPATH = etree.XPath(".//text()[contains(., 'Availability Date:')]")
+# DocBook renders informaltables as <div class="informaltable"><table>, so match
+# the class either on the table itself or on its wrapper
+TABLES_XPATH = etree.XPath(
+    ".//table[contains(concat(' ', normalize-space(@class), ' '), ' informaltable ')"
+    " or parent::div[contains(concat(' ', normalize-space(@class), ' '), ' informaltable ')]]"
+)
+EDGE_DOCS_XPATH = etree.XPath("//div[@data-product-family='SUSE Edge']")
+
+# Column names of the components tables. Header cells are interned too, so
+# every component dict shares these exact key objects
+NAME_KEY = sys.intern("Name")
+VERSION_KEY = sys.intern("Version")
+HELM_KEY = sys.intern("Helm Chart Version")
+ARTIFACT_KEY = sys.intern("Artifact Location (URL/Image)")
+
+RELEASE_ID_RE = re.compile(r"^(?:id-)?release(?:-notes)?-\d+-\d+-\d+$")
+# Second word of a release title, e.g. "3.2.0" in "Release 3.2.0"
+RELEASE_TITLE_RE = re.compile(r"\s*\S+\s+(\S+)")
+CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+DATE_RE = re.compile(r"\d{1,2}(?:st|nd|rd|th) [A-Za-z]+ \d{4}")
+ORDINAL_RE = re.compile(r"(\d)(st|nd|rd|th)")
+
+# Templates are compiled once per process and the compiled bytecode is kept
+# on disk between runs
+JINJA_ENV = Environment(
+    loader=FileSystemLoader("."),
+    bytecode_cache=FileSystemBytecodeCache(),
+    auto_reload=False,
+)
+
+DOCBOOK_NS = "http://docbook.org/ns/docbook"
+ITS_NS = "http://www.w3.org/2005/11/its"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+XML_NS = "http://www.w3.org/XML/1998/namespace"
+DOCBOOK_NSMAP = {
+    None: DOCBOOK_NS,
+    "its": ITS_NS,
+    "xi": "http://www.w3.org/2001/XInclude",
+    "xlink": XLINK_NS,
+}
+# Namespace-qualified names, resolved once instead of per element
+DB = {
+    tag: f"{{{DOCBOOK_NS}}}{tag}"
+    for tag in (
+        "abstract",
+        "article",
+        "colspec",
+        "date",
+        "entry",
+        "info",
+        "informaltable",
+        "link",
+        "meta",
+        "para",
+        "phrase",
+        "revdescription",
+        "revhistory",
+        "revision",
+        "row",
+        "sect1",
+        "tbody",
+        "tgroup",
+        "thead",
+        "title",
+    )
+}
+ITS_TRANSLATE = f"{{{ITS_NS}}}translate"
+XLINK_HREF = f"{{{XLINK_NS}}}href"
+XML_ID = f"{{{XML_NS}}}id"
+XML_LANG = f"{{{XML_NS}}}lang"
+
+# Maximum number of pages fetched at the same time, which is also the size of
+# the connection pool so no concurrent fetch has to wait for a connection
+MAX_CONCURRENCY = 16
+
+# Shared session so all the requests to documentation.suse.com reuse the
+# same keep-alive connections. Responses are cached on disk and revalidated
+# with ETag/Last-Modified, so unchanged pages are not downloaded again.
+SESSION = CachedSession(
+    ".suse_edge_cache", backend="sqlite", expire_after=3600, cache_control=True
+)
+SESSION.headers.update(
+    {
+        "User-Agent": "suse-edge-support-matrix (+https://github.com/e-minguez/suse-edge-support-matrix)"
+    }
+)
+# Keep enough pooled connections for the concurrent fetches and retry
+# transient failures with a backoff
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=MAX_CONCURRENCY,
+        pool_maxsize=MAX_CONCURRENCY,
+        max_retries=Retry(
+            total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504]
+        ),
+    ),
+)
+
+
+def fetch_html(url):
+    """
+    Fetches a page and parses it as HTML.
+    Raises requests.exceptions.HTTPError for bad responses (4xx or 5xx).
+
+    This is the only place where a page is parsed. The helpers below work on
+    elements of the returned tree and must not serialize and re-parse them;
+    use copy.deepcopy() if a detached copy of an element is ever needed.
+    """
+    # The cached session always holds the full body, it reads it to store it
+    # on a miss and loads it from the cache on a hit, so parse it in one go
+    response = SESSION.get(url, timeout=30)
+    response.raise_for_status()
+
+    # Decode with the charset from the Content-Type header when there is one,
+    # otherwise libxml2 only looks at <meta charset> and falls back to Latin-1.
+    # response.encoding is not used as requests defaults it to ISO-8859-1 for
+    # text/* responses without a charset.
+    parser = None
+    charset_match = CHARSET_RE.search(response.headers.get("Content-Type", ""))
+    if charset_match:
+        try:
+            parser = lxml.html.HTMLParser(encoding=charset_match.group(1))
+        except LookupError:
+            pass  # Unknown charset, leave the detection to libxml2
+    return lxml.html.fromstring(response.content, parser=parser)
 
 
 def get_release_sections(url):
@@ -15,13 +152,13 @@ def get_release_sections(url):
         'id-release-X-Y-Z' or 'release-notes-X-Y-Z'
     """
     try:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, "html.parser")
+        doc = fetch_html(url)
 
-        release_sections = soup.find_all(
-            "section", id=re.compile(r"(id-)?release(-notes)?-\d+-\d+-\d+")
-        )
+        release_sections = [
+            section
+            for section in SECTIONS_XPATH(doc)
+            if RELEASE_ID_RE.match(section.get("id"))
+        ]
         return release_sections
 
     except requests.exceptions.RequestException as e:
@@ -37,10 +174,8 @@ def get_components_versions_subsection(release_section):
     Gets the "Components Versions" section from the release section
     """
     try:
-        components = release_section.find(
-            "section", attrs={"data-id-title": "Components Versions"}
-        )
-        return components
+        components = COMPONENTS_SECTION_XPATH(release_section)
+        return components[0] if components else None
     except Exception as e:
         print(f"An error occurred: {e}")
         return None
@@ -50,15 +185,12 @@ def get_availability_date(release_section):
     """
     Gets the "availability date" from the release section
     """
-    date_pattern = r"\d{1,2}(?:st|nd|rd|th) [A-Za-z]+ \d{4}"
     try:
-        date_text_search = release_section.find(
-            string=re.compile(r"Availability Date:")
-        )
+        date_text_search = AVAILABILITY_DATE_XPATH(release_section)
         if date_text_search:
-            date_match = re.findall(date_pattern, date_text_search)
+            date_match = DATE_RE.search(date_text_search[0])
             if date_match:
-                return date_match[0]
+                return date_match.group(0)
         return None
 
     except Exception as e:
@@ -71,7 +203,7 @@ def get_components_versions_tables_from_section(section):
     Gets tables from a given section.
     """
     try:
-        tables = section.find_all("table", attrs={"class" == "informaltable"})
+        tables = TABLES_XPATH(section)
         return tables
 
     except Exception as e:
@@ -79,61 +211,68 @@ def get_components_versions_tables_from_section(section):
         return None
 
 
-def extract_data_from_table(table):
+def extract_data_from_table(table, data):
     """
-    Extracts data from a table and constructs a JSON-like structure.
+    Extracts data from a table into a dictionary keyed by the "Name" column.
     Skips cells with "N/A" or empty values.
+
+    Args:
+        table: The table element.
+        data: The dictionary to populate, the values are dictionaries with the
+            rest of the columns of each row.
     """
-    data = []
-    header = []
-    rows = table.find_all("tr")
+    header = ()
+    name_idx = -1
+    artifact_idx = -1
     first_row = True  # Flag to identify the header row
-    for row in rows:
-        cells = row.find_all(["td", "th"])
+    for row in table.iter("tr"):
+        cells = [cell for cell in row if cell.tag in ("td", "th")]
         if first_row:
-            header = [cell.text.strip() for cell in cells]
+            header = tuple(
+                sys.intern("".join(cell.itertext()).strip()) for cell in cells
+            )
+            name_idx = header.index(NAME_KEY) if NAME_KEY in header else -1
+            artifact_idx = header.index(ARTIFACT_KEY) if ARTIFACT_KEY in header else -1
             first_row = False
         else:
+            name = None
             row_data = {}
-            for i, cell in enumerate(cells):
-                if i < len(header):  # Make sure we don't go out of bounds
-                    value = cell.text.strip()
-                    # Skip empty cells and "N/A" cells
-                    if value and value != "N/A":
-                        row_data[header[i]] = value
-                    # For artifact location, get the raw content
-                    if header[i] == "Artifact Location (URL/Image)":
-                        # Actually, get the content removing the <td>
-                        row_data[header[i]] = "".join([str(c) for c in cell.contents])
-            if row_data:
-                data.append(row_data)
-    return data
-
-
-def get_dicts_by_name(data):
+            # zip() stops at the shorter one, cells without a header are ignored
+            for i, (key, cell) in enumerate(zip(header, cells)):
+                # For artifact location, get the raw content removing the <td>
+                if i == artifact_idx:
+                    row_data[key] = get_inner_html(cell)
+                    continue
+                value = "".join(cell.itertext()).strip()
+                # Skip empty cells and "N/A" cells
+                if value and value != "N/A":
+                    if i == name_idx:
+                        name = value
+                    else:
+                        row_data[key] = value
+            if name:
+                data[name] = row_data
+            elif row_data:
+                print(f"Row missing 'Name' value: {row_data}")
+
+
+def get_inner_html(element):
     """
-    Creates a dictionary where keys are "Name" values from a list of dictionaries.
-
-    Args:
-        data: A list of dictionaries, where each dictionary should have a "Name" key.
-
-    Returns:
-        A dictionary where keys are "Name" values and values are the corresponding dictionaries.
+    Serializes the content of an element, without the element tag itself
     """
-    if not isinstance(data, list):
-        raise TypeError("Input data must be a list.")
-
-    result: Dict[str, Dict[str, Any]] = {}
-    for item in data:
-        if not isinstance(item, dict):
-            continue  # skip non dict items
-        if "Name" in item:
-            name = item["Name"]
-            result[name] = item
-            result[name].pop("Name")
-        else:
-            print("Item missing 'Name' key: %s", item)
-    return result
+    # Serialize as HTML, the XML method would self-close empty children like
+    # <a/> or <span/> and break the page. The tags of an empty copy of the
+    # element tell how much to cut off from both ends.
+    serialized = etree.tostring(
+        element, encoding="unicode", method="html", with_tail=False
+    )
+    tags = etree.tostring(
+        element.makeelement(element.tag, element.attrib),
+        encoding="unicode",
+        method="html",
+    )
+    end_tag = f"</{element.tag}>"
+    return serialized[len(tags) - len(end_tag) : -len(end_tag)]
 
 
 def get_release_data(url):
@@ -153,21 +292,21 @@ def get_release_data(url):
                     print(f"data-id-title not found in section for {url}")
                     continue
 
-                parts = release_title.split()
-                if len(parts) < 2:
+                title_match = RELEASE_TITLE_RE.match(release_title)
+                if not title_match:
                     print(f"Invalid release title format: {release_title} in {url}")
                     continue
-                release_version = parts[1]
+                release_version = title_match.group(1)
 
                 components_section = get_components_versions_subsection(section)
 
                 availability_date = get_availability_date(section)
 
-                if not components_section:
+                if components_section is None:
                     print(f"No components section found for {release_title} in {url}")
                     continue
 
-                release_url = f"{url}#{components_section['id']}"
+                release_url = f"{url}#{components_section.get('id')}"
 
                 tables = get_components_versions_tables_from_section(components_section)
 
@@ -176,15 +315,18 @@ def get_release_data(url):
                         f"No matching tables found in section {release_title} in {url}"
                     )
                     releases_data.append(
-                        {"Version": release_version, "URL": release_url, "Data": []}
+                        {
+                            "Version": release_version,
+                            "URL": release_url,
+                            "AvailabilityDate": availability_date,
+                            "Data": {},
+                        }
                     )  # append empty data
                     continue
 
-                all_table_data = []  # create a list to store data from all tables
+                all_table_data = {}  # components from all tables, keyed by name
                 for table in tables:
-                    table_data = extract_data_from_table(table)
-                    if table_data:
-                        all_table_data.extend(table_data)
+                    extract_data_from_table(table, all_table_data)
 
                 releases_data.append(
                     {
@@ -209,16 +351,15 @@ def get_release_data(url):
 def get_urls(docsurl):
     """Retrieves URLs of the SUSE Edge docs from SUSE documentation pages."""
     try:
-        response = requests.get(docsurl, timeout=30)
-        response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
-
-        soup = BeautifulSoup(response.content, "html.parser")
-        edge_docs = soup.find("div", attrs={"data-product-family": "SUSE Edge"})
+        doc = fetch_html(docsurl)
+        edge_docs = EDGE_DOCS_XPATH(doc)
 
         if not edge_docs:
             print(f"SUSE Edge data not found on {docsurl}")
             return None
 
+        edge_docs = edge_docs[0]
+
         supported_versions_json = edge_docs.get("data-supported-versions")
 
         if not supported_versions_json:
@@ -226,15 +367,22 @@ def get_urls(docsurl):
             return None
 
         try:
-            supported_versions = json.loads(supported_versions_json)
-        except json.JSONDecodeError as e:
+            supported_versions = orjson.loads(supported_versions_json)
+        except orjson.JSONDecodeError as e:
             print(f"Error decoding JSON from {docsurl}: {e}")
             return None
 
-        urls = [
-            f"https://documentation.suse.com/suse-edge/{version['name']}/html/edge/id-release-notes.html"
-            for version in supported_versions
-        ]
+        urls = []
+        for version in supported_versions:
+            # Only the name of each version is needed, skip malformed entries
+            # instead of failing for all of them
+            name = version.get("name") if isinstance(version, dict) else None
+            if not name:
+                print(f"Supported version without a name on {docsurl}: {version}")
+                continue
+            urls.append(
+                f"https://documentation.suse.com/suse-edge/{name}/html/edge/id-release-notes.html"
+            )
         return urls
 
     except Exception as e:
@@ -249,15 +397,22 @@ def get_all_releases_data():
     product_urls = get_urls("https://documentation.suse.com/en-us/?tab=products")
 
     if product_urls:
-        for product_url in product_urls:
+        # Release notes pages are independent, fetch them concurrently.
+        # map() keeps the results in the same order as product_urls.
+        # Each page is parsed by lxml in C, and what is left per page is a few
+        # small tables, so threads are enough here: a process pool would cost
+        # more in startup and pickling than it saves.
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENCY) as executor:
+            results = list(executor.map(get_release_data, product_urls))
+
+        for product_url, releases in zip(product_urls, results):
             try:
-                releases = get_release_data(product_url)
                 if releases:
                     for release in releases:
                         version = release["Version"]
                         url = release["URL"]
                         availability_date = release["AvailabilityDate"]
-                        processed_data = get_dicts_by_name(release["Data"])
+                        processed_data = release["Data"]
                         if processed_data:
                             all_releases.append(
                                 {
@@ -274,6 +429,7 @@ def get_all_releases_data():
     return all_releases
 
 
+@lru_cache(maxsize=512)
 def convert_date_format(date_string):
     """
     Converts a date string in "DDth Month YYYY" format to "YYYY-MM-DD" format.
@@ -284,104 +440,70 @@ def convert_date_format(date_string):
     Returns:
         str: The converted date string, or None if the conversion fails.
     """
+    # Skip anything that cannot be a date, including a missing one
+    if not date_string or not date_string[0].isdigit():
+        return None
     try:
-        clean_string = re.sub(r"(\d)(st|nd|rd|th)", r"\1", date_string)
+        clean_string = ORDINAL_RE.sub(r"\1", date_string)
         date_object = datetime.datetime.strptime(clean_string, "%d %B %Y")
         return date_object.strftime("%Y-%m-%d")
     except ValueError:
         return None
 
 
-def create_xml_with_elementmaker(data):
+def create_article_xml(data):
     """Creates the main XML structure."""
 
-    E = ElementMaker(
-        namespace="http://docbook.org/ns/docbook",
-        nsmap={
-            None: "http://docbook.org/ns/docbook",
-            "its": "http://www.w3.org/2005/11/its",
-            "xi": "http://www.w3.org/2001/XInclude",
-            "xlink": "http://www.w3.org/1999/xlink",
-            "xml": "http://www.w3.org/XML/1998/namespace",
-        },
-    )
-
-    ARTICLE = E.article
-    TITLE = E.title
-    INFO = E.info
-    DATE = E.date
-    ABSTRACT = E.abstract
-    PARA = E.para
-    LINK = E.link
-    META = E.meta
-    NAME = E.name
-    VALUE = E.value
-    PHRASE = E.phrase
-    REVHISTORY = E.revhistory
-    REVISION = E.revision
-    REVDESCRIPTION = E.revdescription
-
     now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S %Z")
 
-    revhistory_element = REVHISTORY(
-        **{"{http://www.w3.org/XML/1998/namespace}id": "rh-edge-support-matrix"}
+    revhistory_element = etree.Element(
+        DB["revhistory"], {XML_ID: "rh-edge-support-matrix"}, nsmap=DOCBOOK_NSMAP
     )
     for release in data:
         date = convert_date_format(release["AvailabilityDate"])
-        description = f"Added SUSE Edge {release["Version"]}"
-        revhistory_element.append(
-            REVISION(DATE(date), REVDESCRIPTION(PARA(description)))
-        )
+        description = f"Added SUSE Edge {release['Version']}"
+        revision = etree.SubElement(revhistory_element, DB["revision"])
+        etree.SubElement(revision, DB["date"]).text = date
+        revdescription = etree.SubElement(revision, DB["revdescription"])
+        etree.SubElement(revdescription, DB["para"]).text = description
+
+    root = etree.Element(
+        DB["article"],
+        {"version": "5.2", XML_ID: "article-installation", XML_LANG: "en"},
+        nsmap=DOCBOOK_NSMAP,
+    )
+    etree.SubElement(root, DB["title"]).text = "SUSE Edge support matrix"
 
-    root = ARTICLE(
-        TITLE("SUSE Edge support matrix"),
-        INFO(
-            DATE(now),
-            ABSTRACT(
-                PARA(
-                    "The following tables describe the individual components that make up the SUSE Edge releases, including the version, the Helm chart version (if applicable), and from where the released artifact can be pulled in the binary format. this information is also provided for processing in JSON format."
-                ),
-                PARA(
-                    LINK(
-                        "https://documentation.suse.com/suse-edge/",
-                        **{
-                            "{http://www.w3.org/1999/xlink}href": "https://documentation.suse.com/suse-edge/"
-                        },
-                    )
-                ),
-            ),
-            META(
-                "SUSE Edge support matrix",
-                name="title",
-                **{"{http://www.w3.org/2005/11/its}translate": "yes"},
-            ),
-            META(
-                "Products & Solutions",
-                name="series",
-                **{"{http://www.w3.org/2005/11/its}translate": "no"},
-            ),
-            META(
-                "A complete list of components for all SUSE Edge releases",
-                name="description",
-                **{"{http://www.w3.org/2005/11/its}translate": "yes"},
-            ),
-            META(
-                "List of components for all SUSE Edge releases",
-                name="social-descr",
-                **{"{http://www.w3.org/2005/11/its}translate": "yes"},
-            ),
-            META(
-                PHRASE("Implementation"),
-                name="task",
-                **{"{http://www.w3.org/2005/11/its}translate": "no"},
-            ),
-        ),
-        version="5.2",
-        **{
-            "{http://www.w3.org/XML/1998/namespace}id": "article-installation",
-            "{http://www.w3.org/XML/1998/namespace}lang": "en",
-        },
+    info = etree.SubElement(root, DB["info"])
+    etree.SubElement(info, DB["date"]).text = now
+    abstract = etree.SubElement(info, DB["abstract"])
+    etree.SubElement(abstract, DB["para"]).text = (
+        "The following tables describe the individual components that make up the SUSE Edge releases, including the version, the Helm chart version (if applicable), and from where the released artifact can be pulled in the binary format. this information is also provided for processing in JSON format."
+    )
+    link = etree.SubElement(
+        etree.SubElement(abstract, DB["para"]),
+        DB["link"],
+        {XLINK_HREF: "https://documentation.suse.com/suse-edge/"},
     )
+    link.text = "https://documentation.suse.com/suse-edge/"
+
+    for text, name, translate in (
+        ("SUSE Edge support matrix", "title", "yes"),
+        ("Products & Solutions", "series", "no"),
+        (
+            "A complete list of components for all SUSE Edge releases",
+            "description",
+            "yes",
+        ),
+        ("List of components for all SUSE Edge releases", "social-descr", "yes"),
+    ):
+        meta = etree.SubElement(
+            info, DB["meta"], {"name": name, ITS_TRANSLATE: translate}
+        )
+        meta.text = text
+    meta = etree.SubElement(info, DB["meta"], {"name": "task", ITS_TRANSLATE: "no"})
+    etree.SubElement(meta, DB["phrase"]).text = "Implementation"
+
     return root
 
 
@@ -396,78 +518,46 @@ def create_sect1_xml(data):
         lxml.etree._Element: The <sect1> element.
     """
 
-    E = ElementMaker(
-        namespace="http://docbook.org/ns/docbook",
-        nsmap={
-            None: "http://docbook.org/ns/docbook",
-            "xlink": "http://www.w3.org/1999/xlink",
-            "xml": "http://www.w3.org/XML/1998/namespace",
-        },
-    )
-
-    SECT1 = E.sect1
-    TITLE = E.title
-    PARA = E.para
-    LINK = E.link
-    INFORMALTABLE = E.informaltable
-    TGROUP = E.tgroup
-    COLSPEC = E.colspec
-    THEAD = E.thead
-    ROW = E.row
-    ENTRY = E.entry
-    TBODY = E.tbody
-
-    title = f"Release {data["Version"]}"
     # Extract version and remove dots for xml:id
     version = data.get("Version", "Unknown")
     sect1_id = "edge-" + version.replace(".", "")
-    json_link = "TBD"
-
-    root = SECT1(
-        TITLE(f"Release {version}"),
-        PARA(
-            LINK(
-                "Download as JSON",
-                **{"{http://www.w3.org/1999/xlink}href": data.get("URL", "#")},
-            )
-        ),
-        INFORMALTABLE(
-            TGROUP(
-                COLSPEC(colnum="1", colname="1", colwidth="20*"),
-                COLSPEC(colnum="2", colname="2", colwidth="15*"),
-                COLSPEC(colnum="3", colname="3", colwidth="15*"),
-                COLSPEC(colnum="4", colname="4", colwidth="50*"),
-                THEAD(
-                    ROW(
-                        ENTRY(PARA("Name")),
-                        ENTRY(PARA("Version")),
-                        ENTRY(PARA("Helm Chart Version")),
-                        ENTRY(PARA("Artifact Location (URL/Image)")),
-                    )
-                ),
-                TBODY(
-                    *[
-                        create_row_from_component(E, component_name, component_data)
-                        for component_name, component_data in data.get(
-                            "Data", {}
-                        ).items()
-                    ]
-                ),
-                cols="4",
-            )
-        ),
-        **{"{http://www.w3.org/XML/1998/namespace}id": sect1_id},
+
+    root = etree.Element(DB["sect1"], {XML_ID: sect1_id}, nsmap=DOCBOOK_NSMAP)
+    etree.SubElement(root, DB["title"]).text = f"Release {version}"
+    link = etree.SubElement(
+        etree.SubElement(root, DB["para"]),
+        DB["link"],
+        {XLINK_HREF: data.get("URL", "#")},
     )
+    link.text = "Download as JSON"
+
+    informaltable = etree.SubElement(root, DB["informaltable"])
+    tgroup = etree.SubElement(informaltable, DB["tgroup"], {"cols": "4"})
+    for colnum, colwidth in (("1", "20*"), ("2", "15*"), ("3", "15*"), ("4", "50*")):
+        etree.SubElement(
+            tgroup,
+            DB["colspec"],
+            {"colnum": colnum, "colname": colnum, "colwidth": colwidth},
+        )
+
+    header_row = etree.SubElement(etree.SubElement(tgroup, DB["thead"]), DB["row"])
+    for heading in (NAME_KEY, VERSION_KEY, HELM_KEY, ARTIFACT_KEY):
+        entry = etree.SubElement(header_row, DB["entry"])
+        etree.SubElement(entry, DB["para"]).text = heading
+
+    tbody = etree.SubElement(tgroup, DB["tbody"])
+    for component_name, component_data in data.get("Data", {}).items():
+        create_row_from_component(tbody, component_name, component_data)
 
     return root
 
 
-def create_row_from_component(E, component_name, component_data):
+def create_row_from_component(tbody, component_name, component_data):
     """
     Creates a <tbody> <row> element for a component.
 
     Args:
-        E (ElementMaker): The ElementMaker instance.
+        tbody (lxml.etree._Element): The <tbody> element to append the row to.
         component_name (str): The name of the component.
         component_data (dict): The component's data.
 
@@ -475,70 +565,86 @@ def create_row_from_component(E, component_name, component_data):
         lxml.etree._Element: The <tbody> <row> element.
     """
 
-    ROW = E.row
-    ENTRY = E.entry
-    PARA = E.para
-
     name = component_name
-    version = component_data.get("Version", "N/A")
-    helm_chart_version = component_data.get("Helm Chart Version", "N/A")
-    artifact_location = component_data.get("Artifact Location (URL/Image)", "")
+    version = component_data.get(VERSION_KEY, "N/A")
+    helm_chart_version = component_data.get(HELM_KEY, "N/A")
+    artifact_location = component_data.get(ARTIFACT_KEY, "")
+
+    row = etree.SubElement(tbody, DB["row"])
+    for text in (name, version, helm_chart_version):
+        etree.SubElement(etree.SubElement(row, DB["entry"]), DB["para"]).text = text
+    artifact_entry = etree.SubElement(row, DB["entry"])
 
-    # Handle Artifact Location (URL/Image) - Parse HTML-like strings
-    artifact_elements = []
+    # Handle Artifact Location (URL/Image) - Parse the HTML fragment
     if artifact_location:
-        # Simple HTML-like tag parsing (very basic, adjust if needed)
-        for part in re.split(r"(<[^>]+>)", artifact_location):
-            if part.startswith("<a"):
-                match = re.search(r'href="([^"]+)"', part)
-                if match:
-                    href = match.group(1)
-                    text = re.sub(r"<[^>]+>", "", part)  # Remove tags
-                    artifact_elements.append(
-                        PARA(
-                            E.link(text, **{"{http://www.w3.org/1999/xlink}href": href})
-                        )
-                    )
-            elif part and not part.startswith("<"):
-                for subpart in part.split("<br/>"):
-                    artifact_elements.append(PARA(subpart))
-
-    return ROW(
-        ENTRY(PARA(name)),
-        ENTRY(PARA(version)),
-        ENTRY(PARA(helm_chart_version)),
-        ENTRY(*artifact_elements),
-    )
+        for fragment in lxml.html.fragments_fromstring(artifact_location):
+            if isinstance(fragment, str):
+                # Leading text before the first tag
+                if fragment.strip():
+                    para = etree.SubElement(artifact_entry, DB["para"])
+                    para.text = fragment.strip()
+            else:
+                create_paras_from_html(artifact_entry, fragment)
+
+    return row
+
+
+def create_paras_from_html(parent, element):
+    """
+    Creates <para> elements from an HTML element, one per link or text line.
+
+    Args:
+        parent (lxml.etree._Element): The element to append the <para> elements to.
+        element (lxml.html.HtmlElement): The HTML element to convert.
+    """
+
+    if not isinstance(element.tag, str):
+        pass  # Comment or processing instruction, only its tail is content
+    elif element.tag == "a" and element.get("href"):
+        link = etree.SubElement(
+            etree.SubElement(parent, DB["para"]),
+            DB["link"],
+            {XLINK_HREF: element.get("href")},
+        )
+        link.text = element.text_content().strip()
+    else:
+        if element.text and element.text.strip():
+            etree.SubElement(parent, DB["para"]).text = element.text.strip()
+        for child in element:
+            create_paras_from_html(parent, child)
+
+    if element.tail and element.tail.strip():
+        etree.SubElement(parent, DB["para"]).text = element.tail.strip()
 
 
 def save_json(data):
     """Saves a json file per release with the actual content"""
     for release in data:
         try:
-            with open(f"{release['Version']}.json", "w", encoding="utf-8") as f:
-                json.dump(release, f, indent=2)
+            with open(f"{release['Version']}.json", "wb") as f:
+                f.write(orjson.dumps(release, option=orjson.OPT_INDENT_2))
         except IOError as e:
             print(f"Error saving JSON file: {e}")
 
 
 def save_xml(data):
-    root = create_xml_with_elementmaker(data)
+    root = create_article_xml(data)
     for release in data:
         # Generate and inject sect1 sections
         root.append(create_sect1_xml(release))
 
-    # Convert the XML tree to a string
-    declaration = '<?xml version="1.0" encoding="utf-8"?>\n'
-    stylesheet_pi = '<?xml-stylesheet href="urn:x-suse:xslt:profiling:docbook50-profile.xsl" type="text/xml" title="Profiling step"?>\n'
-    doctype = "<!DOCTYPE article>\n"
-    xml_string = etree.tostring(root, encoding="utf-8", pretty_print=True).decode(
-        "utf-8"
-    )
+    declaration = b'<?xml version="1.0" encoding="utf-8"?>\n'
+    stylesheet_pi = b'<?xml-stylesheet href="urn:x-suse:xslt:profiling:docbook50-profile.xsl" type="text/xml" title="Profiling step"?>\n'
+    doctype = b"<!DOCTYPE article>\n"
 
     output_file = "output.xml"
     try:
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(declaration + stylesheet_pi + doctype + xml_string)
+        with open(output_file, "wb") as f:
+            f.write(declaration + stylesheet_pi + doctype)
+            # Serialize the XML tree straight into the file
+            etree.ElementTree(root).write(
+                f, encoding="utf-8", pretty_print=True, xml_declaration=False
+            )
     except IOError as e:
         print(f"Error writing to {output_file}: {e}")
     except Exception as e:
@@ -558,15 +664,12 @@ def generate_html(template_file, output_file, data):
         The path of the generated HTML file, or an empty string on error.
     """
     try:
-        with open(template_file, "r", encoding="utf-8") as file:
-            template_content = file.read()
-
-        template = Template(template_content)
+        template = JINJA_ENV.get_template(template_file)
         generation_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S %Z")
-        rendered_html = template.render(data=data, generation_time=generation_time)
-
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(rendered_html)
+        # Render straight into the file instead of building the whole page first
+        template.stream(data=data, generation_time=generation_time).dump(
+            output_file, encoding="utf-8"
+        )
 
         return output_file
 